@@ -2,6 +2,23 @@
 
 # Docker utilities for AlphaFold benchmarking
 
+# GPU flags; the runner pins each concurrent run to one device via AF_GPU_DEVICE
+gpu_flags() {
+    if [ -n "$AF_GPU_DEVICE" ]; then
+        echo "--gpus device=$AF_GPU_DEVICE"
+    else
+        echo "--gpus all"
+    fi
+}
+
+# Label containers with the runner's batch ID so sibling runs can be told apart
+# from unrelated AlphaFold containers (see check_running_processes)
+batch_label_flags() {
+    if [ -n "$AF_BATCH_ID" ]; then
+        echo "--label afsysbench.batch=$AF_BATCH_ID"
+    fi
+}
+
 # Build base Docker command
 build_docker_base() {
     local docker_cmd="docker run --rm"
@@ -11,6 +28,10 @@ build_docker_base() {
         docker_cmd+=" -it"
     fi
     
+    if [ -n "$AF_BATCH_ID" ]; then
+        docker_cmd+=" $(batch_label_flags)"
+    fi
+    
     echo "$docker_cmd"
 }
 
@@ -51,7 +72,7 @@ add_gpu_support() {
     local system_type=$2
     
     if [ "$system_type" = "gpu" ]; then
-        docker_cmd+=" --gpus all"
+        docker_cmd+=" $(gpu_flags)"
     fi
     
     echo "$docker_cmd"
@@ -142,6 +163,73 @@ add_profiling_config() {
     echo "$docker_cmd"
 }
 
+# Check whether a run can use the runner's persistent container
+# The runner may start one long-lived container (AF_PERSISTENT_CONTAINER) with the
+# workspace AF_PERSISTENT_ROOT mounted at the same path, AF_PERSISTENT_DB_DIR at /db
+# and AF_PERSISTENT_MODEL_DIR at /root/models. Non-profiling runs whose mounts match
+# and whose paths live under that root use docker exec instead of paying for a
+# fresh docker run.
+# Usage: use_persistent_container <db_dir> <model_dir or ""> <path>...
+use_persistent_container() {
+    local db_dir=$1
+    local model_dir=$2
+    shift 2
+    local path
+    
+    [ -n "$AF_PERSISTENT_CONTAINER" ] || return 1
+    [ "$PROFILING_ENABLED" != true ] || return 1
+    
+    # Mounts can't be added to a running container
+    [ -z "$CUSTOM_MOUNTS" ] || return 1
+    
+    # The container must mount the same databases and models this run would
+    [ -n "$db_dir" ] && [ "$(realpath "$db_dir")" = "$AF_PERSISTENT_DB_DIR" ] || return 1
+    if [ -n "$model_dir" ]; then
+        [ "$(realpath "$model_dir")" = "$AF_PERSISTENT_MODEL_DIR" ] || return 1
+    fi
+    
+    for path in "$@"; do
+        case "$(realpath "$path")/" in
+            "$AF_PERSISTENT_ROOT"/*) ;;
+            *) return 1 ;;
+        esac
+    done
+    
+    return 0
+}
+
+# Build docker exec prefix for the persistent container (container ID not included)
+build_exec_base() {
+    local docker_cmd="docker exec"
+    
+    # The container sees every GPU; restrict this run to its assigned device
+    if [ -n "$AF_GPU_DEVICE" ]; then
+        docker_cmd+=" -e CUDA_VISIBLE_DEVICES=$AF_GPU_DEVICE"
+    fi
+    
+    echo "$docker_cmd"
+}
+
+# Build docker exec counterpart of build_docker_command (same environment)
+build_exec_command() {
+    local threads=$1
+    local unified_memory=$2
+    
+    local docker_cmd=$(build_exec_base)
+    
+    # Add unified memory configuration
+    if [ "$unified_memory" = true ]; then
+        docker_cmd+=" -e XLA_PYTHON_CLIENT_PREALLOCATE=false"
+        docker_cmd+=" -e TF_FORCE_UNIFIED_MEMORY=true"
+        docker_cmd+=" -e XLA_CLIENT_MEM_FRACTION=3.2"
+    fi
+    
+    docker_cmd+=" -e OMP_NUM_THREADS=$threads"
+    docker_cmd+=" $AF_PERSISTENT_CONTAINER"
+    
+    echo "$docker_cmd"
+}
+
 # Build complete Docker command for AlphaFold MSA
 build_msa_docker_command() {
     local input_file=$1
@@ -151,6 +239,24 @@ build_msa_docker_command() {
     local docker_image=$5
     local system_type=$6
     
+    # Reuse the persistent container if the runner started one
+    if use_persistent_container "$db_dir" "" "$input_file" "$output_dir"; then
+        local docker_cmd=$(build_exec_base)
+        docker_cmd=$(add_environment_vars "$docker_cmd" "$threads")
+        docker_cmd=$(add_unified_memory_config "$docker_cmd" "$(basename "$input_file" .json)")
+        docker_cmd+=" $AF_PERSISTENT_CONTAINER"
+        docker_cmd+=" python run_alphafold.py"
+        docker_cmd+=" --json_path=$(realpath "$input_file")"
+        docker_cmd+=" --output_dir=$(realpath "$output_dir")"
+        docker_cmd+=" --db_dir=/db"
+        docker_cmd+=" --max_template_date=2023-01-01"
+        docker_cmd+=" --run_data_pipeline=true"
+        docker_cmd+=" --run_inference=false"
+        
+        echo "$docker_cmd"
+        return 0
+    fi
+    
     # Start with base command
     local docker_cmd=$(build_docker_base)
     
@@ -317,9 +423,13 @@ build_docker_command() {
     
     local docker_cmd="docker run --rm"
     
+    if [ -n "$AF_BATCH_ID" ]; then
+        docker_cmd="$docker_cmd $(batch_label_flags)"
+    fi
+    
     # Add GPU support if enabled
     if [ "$use_gpu" = true ]; then
-        docker_cmd="$docker_cmd --gpus all"
+        docker_cmd="$docker_cmd $(gpu_flags)"
     fi
     
     # Add unified memory configuration
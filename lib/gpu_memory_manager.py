@@ -6,6 +6,7 @@ GPU Memory Manager for intelligent unified memory handling
 import subprocess
 import json
 import os
+import re
 import logging
 from pathlib import Path
 from typing import Dict, Tuple, Optional
@@ -23,16 +24,50 @@ class GPUMemoryManager:
         'rcsb_pdb_7rce_data': 6000,      # 6GB
     }
     
+    # OOM signatures from CUDA/JAX/TF logs, matched as one regex alternation
+    _OOM_RE = re.compile('|'.join([
+        'CUDA_ERROR_OUT_OF_MEMORY',
+        'CUDA out of memory',
+        'OOM when allocating tensor',
+        'ResourceExhaustedError',
+        'failed to allocate.*memory',
+        'GPU memory allocation failed',
+    ]))
+    
     def __init__(self, safety_factor: float = 1.2):
         self.safety_factor = safety_factor
         self.logger = logging.getLogger(__name__)
         self._gpu_memory_cache = None
+        self._estimate_cache = {}
         
+    def _get_nvml_memory_mb(self) -> Optional[int]:
+        """Query GPU 0 memory through NVML; None if pynvml or the driver is unavailable"""
+        try:
+            import pynvml
+        except ImportError:
+            return None
+            
+        try:
+            pynvml.nvmlInit()
+            try:
+                handle = pynvml.nvmlDeviceGetHandleByIndex(0)
+                return pynvml.nvmlDeviceGetMemoryInfo(handle).total // (1024 * 1024)
+            finally:
+                pynvml.nvmlShutdown()
+        except pynvml.NVMLError:
+            return None
+            
     def get_gpu_memory_mb(self) -> int:
         """Get GPU memory capacity in MB"""
         if self._gpu_memory_cache is not None:
             return self._gpu_memory_cache
             
+        # Try NVML first (no process launch)
+        nvml_memory = self._get_nvml_memory_mb()
+        if nvml_memory is not None:
+            self._gpu_memory_cache = nvml_memory
+            return self._gpu_memory_cache
+            
         try:
             # Try nvidia-smi
             result = subprocess.run(
@@ -42,7 +77,7 @@ class GPUMemoryManager:
             if result.returncode == 0:
                 self._gpu_memory_cache = int(result.stdout.strip().split('\n')[0])
                 return self._gpu_memory_cache
-        except (subprocess.SubprocessError, ValueError):
+        except (OSError, subprocess.SubprocessError, ValueError):
             pass
             
         # Try docker if nvidia-smi failed
@@ -72,12 +107,23 @@ class GPUMemoryManager:
             
         # Estimate based on file size
         try:
-            file_size_mb = os.path.getsize(input_file) / (1024 * 1024)
-            # Rough estimate: 1000x file size
-            return int(file_size_mb * 1000)
+            st = os.stat(input_file)
         except OSError:
+            # Not cached: the file may appear later
             return 8000  # Default 8GB
             
+        # Cached per path with its mtime/size, so an edited input gets a fresh estimate
+        stamp = (st.st_mtime_ns, st.st_size)
+        cached = self._estimate_cache.get(input_file)
+        if cached is not None and cached[0] == stamp:
+            return cached[1]
+            
+        file_size_mb = st.st_size / (1024 * 1024)
+        # Rough estimate: 1000x file size
+        estimate = int(file_size_mb * 1000)
+        self._estimate_cache[input_file] = (stamp, estimate)
+        return estimate
+            
     def needs_unified_memory(self, input_file: str) -> Tuple[bool, Dict[str, int]]:
         """
         Check if unified memory is needed
@@ -121,20 +167,11 @@ class GPUMemoryManager:
         
     def check_oom_error(self, log_file: str) -> bool:
         """Check if log file contains OOM errors"""
-        oom_patterns = [
-            'CUDA_ERROR_OUT_OF_MEMORY',
-            'CUDA out of memory',
-            'OOM when allocating tensor',
-            'ResourceExhaustedError',
-            'failed to allocate.*memory',
-            'GPU memory allocation failed',
-        ]
-        
         try:
-            with open(log_file, 'r') as f:
-                content = f.read()
-                for pattern in oom_patterns:
-                    if pattern in content:
+            # Scan line by line and stop at the first match
+            with open(log_file, 'r', errors='replace') as f:
+                for line in f:
+                    if self._OOM_RE.search(line):
                         return True
         except IOError:
             pass
@@ -411,8 +411,14 @@ validate_output_directory() {
 check_running_processes() {
     local force=${1:-false}
     
-    # Check for running Docker containers
-    local running_containers=$(docker ps --filter "ancestor=$DOCKER_IMAGE" --format "{{.ID}}" | wc -l)
+    # Check for running Docker containers; those labelled with our own batch ID
+    # (concurrent runs started by the runner) are not counted
+    local running_containers
+    if [ -n "$AF_BATCH_ID" ]; then
+        running_containers=$(docker ps --filter "ancestor=$DOCKER_IMAGE" --format '{{.Label "afsysbench.batch"}}' | grep -cvxF "$AF_BATCH_ID" || true)
+    else
+        running_containers=$(docker ps --filter "ancestor=$DOCKER_IMAGE" --format "{{.ID}}" | wc -l)
+    fi
     
     if [ "$running_containers" -gt 0 ]; then
         log_warn "Found $running_containers running AlphaFold container(s)"
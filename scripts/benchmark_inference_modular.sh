@@ -19,6 +19,7 @@ init_logging "benchmark_inference"
 # Default values
 JSON_FILE=""
 OVERRIDE_THREADS=""
+OVERRIDE_OUTPUT_DIR=""
 NSYS_PROFILING=false
 PERFORMANCE_ONLY=false
 USE_GPU=true
@@ -35,6 +36,7 @@ show_usage() {
     echo ""
     echo "Options:"
     echo "  -t <threads>      Override thread counts (e.g., '4 8 16')"
+    echo "  -o <dir>          Override output base directory"
     echo "  -n, --nsys        Enable NSYS profiling"
     echo "  -p, --perf-only   Performance timing only (no profiling)"
     echo "  --cpu-only        Force CPU-only inference"
@@ -66,6 +68,10 @@ while [[ $# -gt 0 ]]; do
             OVERRIDE_THREADS="$2"
             shift 2
             ;;
+        -o|--output)
+            OVERRIDE_OUTPUT_DIR="$2"
+            shift 2
+            ;;
         -n|--nsys)
             NSYS_PROFILING=true
             shift
@@ -126,6 +132,9 @@ load_config "$CONFIG_FILE"
 if [ -n "$OVERRIDE_THREADS" ]; then
     THREAD_COUNTS="$OVERRIDE_THREADS"
 fi
+if [ -n "$OVERRIDE_OUTPUT_DIR" ]; then
+    INFERENCE_OUTPUT_BASE="$OVERRIDE_OUTPUT_DIR"
+fi
 
 # Determine Docker image and run purpose
 ACTUAL_DOCKER_IMAGE="$DOCKER_IMAGE"
@@ -238,10 +247,21 @@ for N in $THREAD_COUNTS; do
     start_time=$(date +%s.%N)
     run_timestamp=$(date +%Y-%m-%d_%H:%M:%S)
     
+    # Paths as seen inside the container; the persistent container sees host paths
+    INPUT_DIR=$(dirname "$FULL_INPUT_PATH")
+    CONTAINER_INPUT_DIR="/input"
+    CONTAINER_OUTPUT_DIR="/output"
+    USE_PERSISTENT=false
+    if [ "$NSYS_PROFILING" != true ] && use_persistent_container "$DB_DIR" "$MODEL_DIR" "$INPUT_DIR" "$RUN_DIR"; then
+        USE_PERSISTENT=true
+        CONTAINER_INPUT_DIR=$(realpath "$INPUT_DIR")
+        CONTAINER_OUTPUT_DIR=$(realpath "$RUN_DIR")
+    fi
+    
     # Prepare AlphaFold command
     AF_CMD="python run_alphafold.py \
-        --json_path=/input/$JSON_FILENAME \
-        --output_dir=/output \
+        --json_path=$CONTAINER_INPUT_DIR/$JSON_FILENAME \
+        --output_dir=$CONTAINER_OUTPUT_DIR \
         --db_dir=/db \
         --run_data_pipeline=false \
         --run_inference=true"
@@ -251,16 +271,19 @@ for N in $THREAD_COUNTS; do
     fi
     
     # Build Docker command using shared library
-    INPUT_DIR=$(dirname "$FULL_INPUT_PATH")
-    DOCKER_CMD=$(build_docker_command \
-        "$ACTUAL_DOCKER_IMAGE" \
-        "$N" \
-        "$USE_GPU" \
-        "$UNIFIED_MEMORY" \
-        "$INPUT_DIR" \
-        "$RUN_DIR" \
-        "$DB_DIR" \
-        "$MODEL_DIR")
+    if [ "$USE_PERSISTENT" = true ]; then
+        DOCKER_CMD=$(build_exec_command "$N" "$UNIFIED_MEMORY")
+    else
+        DOCKER_CMD=$(build_docker_command \
+            "$ACTUAL_DOCKER_IMAGE" \
+            "$N" \
+            "$USE_GPU" \
+            "$UNIFIED_MEMORY" \
+            "$INPUT_DIR" \
+            "$RUN_DIR" \
+            "$DB_DIR" \
+            "$MODEL_DIR")
+    fi
     
     # Execute with or without NSYS/perf profiling
     if [ "$NSYS_PROFILING" = true ]; then
@@ -372,7 +395,7 @@ EOF
     else
         log_info "Running performance timing only..."
         
-        $DOCKER_CMD bash -c "$AF_CMD 2>&1 | tee /output/alphafold.log"
+        $DOCKER_CMD bash -c "$AF_CMD 2>&1 | tee $CONTAINER_OUTPUT_DIR/alphafold.log"
         EXIT_CODE=$?
         
         NSYS_PROFILE="N/A"
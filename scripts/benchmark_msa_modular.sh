@@ -18,6 +18,7 @@ source "$SCRIPT_DIR/../lib/result_parser.sh"
 CONFIG_FILE=""
 JSON_FILE=""
 OVERRIDE_THREADS=""
+OVERRIDE_OUTPUT_DIR=""
 FORCE_RUN=false
 
 # Usage function
@@ -30,6 +31,7 @@ show_usage() {
     echo ""
     echo "Options:"
     echo "  -t <threads>      Override thread counts (e.g., '4 8 16')"
+    echo "  -o <dir>          Override output base directory"
     echo "  -n, --no-monitor  Disable system monitoring"
     echo "  --peak            Enable peak memory monitoring"
     echo "  --force           Force run even if other processes exist"
@@ -52,6 +54,10 @@ while [[ $# -gt 0 ]]; do
             OVERRIDE_THREADS="$2"
             shift 2
             ;;
+        -o|--output)
+            OVERRIDE_OUTPUT_DIR="$2"
+            shift 2
+            ;;
         -n|--no-monitor)
             SYSTEM_MONITOR=false
             shift